@@ -736,7 +736,7 @@ class DesktopHelper(QApplication):
                     self.overlay = None
             
             if platform.system() == 'Windows':
-                from overlay import OverlayWindow, SimpleOverlayWindow
+                from overlay import SimpleOverlayWindow
                 
                 # Always use simple mode for now to prevent blocking
                 self.overlay = SimpleOverlayWindow(
@@ -17,19 +17,20 @@ Requirements:
 import time
 import math
 import platform
+from collections import deque
 from typing import List, Tuple
 import logging
 
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt, QTimer, QRect
-from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QGuiApplication
+from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QPixmap, QRegion, QGuiApplication
 
 # Windows API imports (only on Windows)
 if platform.system() == "Windows":
     try:
-        import win32gui
         import win32con
-        from ctypes import windll
+        import ctypes
+        from ctypes import windll, wintypes
         HAS_WIN32 = True
     except ImportError:
         HAS_WIN32 = False
@@ -37,9 +38,23 @@ if platform.system() == "Windows":
 else:
     HAS_WIN32 = False
 
+if HAS_WIN32:
+    # user32 entry points for the extended-style path, resolved once with explicit signatures
+    _GetWindowLong = windll.user32.GetWindowLongW
+    _GetWindowLong.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLong.restype = wintypes.LONG
+    _SetWindowLong = windll.user32.SetWindowLongW
+    _SetWindowLong.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    _SetWindowLong.restype = wintypes.LONG
+
 logger = logging.getLogger(__name__)
 
 
+def _now_ms() -> int:
+    """Monotonic clock in integer milliseconds, used for all dot timestamps."""
+    return time.monotonic_ns() // 1_000_000
+
+
 class SimpleOverlayWindow(QWidget):
     """Simple overlay window without layered transparency - more reliable.
 
@@ -48,7 +63,17 @@ class SimpleOverlayWindow(QWidget):
     - Fully transparent background (removed residual 1 alpha fill) to eliminate black screen
     - Paint diagnostics (counts, devicePixelRatio, geometry) for troubleshooting
     - Heuristic coordinate scaling if incoming dots appear outside widget bounds due to DPI scaling
+    - Dot storage is a fixed-capacity ring buffer so a tap flood cannot grow memory unboundedly
     """
+
+    # Highest sustained tap rate (dots/second) the overlay is sized for
+    MAX_TAP_RATE = 120
+    # Hard ceiling on stored dots regardless of fade duration
+    MAX_DOTS = 2048
+    # Number of cached pre-faded sprites the 0-255 alpha range is quantized into (power of two)
+    ALPHA_BUCKETS = 16
+    # Up to this many live dots, a fade tick repaints each dot box rather than their bounding rect
+    FADE_UNION_LIMIT = 64
     
     def __init__(self, x: int, y: int, width: int, height: int, 
                  dot_color: str = '#FFFF00', dot_radius: int = 20, fade_ms: int = 10000,
@@ -64,13 +89,32 @@ class SimpleOverlayWindow(QWidget):
         # Configuration
         self.dot_color = QColor(dot_color)
         self.dot_radius = dot_radius
-        self.fade_ms = fade_ms
+        self.fade_ms = int(fade_ms)
         self.debug_bg = debug_bg
         self.force_basic = force_basic
         
-        # Simple dot storage: list of (x, y, timestamp) tuples
-        self.dots = []
-        self.DOT_DURATION = fade_ms / 1000.0  # Convert ms to seconds
+        # Dot storage: ring buffer of (x0, y0, timestamp_ms) tuples in insertion order, where
+        # (x0, y0) is the integer top-left of the dot's sprite, computed once when the dot is added.
+        # Sized for MAX_TAP_RATE over one fade; when full the oldest dot is dropped (and erased).
+        capacity = max(1, min(self.MAX_DOTS, math.ceil(fade_ms * self.MAX_TAP_RATE / 1000)))
+        self.dots = deque(maxlen=capacity)
+
+        # Pre-rendered dot sprites, one per alpha bucket, built lazily and dropped when the
+        # device pixel ratio changes; each dot is a single drawPixmap of its bucket's sprite
+        self._sprite_cache = {}
+        self._sprite_dpr = None
+        self._sprite_for(self.ALPHA_BUCKETS - 1, self.devicePixelRatioF())
+
+        # Per-tile input throttle: taps within one dot-sized tile closer together than
+        # _min_dot_interval_ms are dropped before they reach the dot store / repaint path
+        self._min_dot_interval_ms = 1000 // self.MAX_TAP_RATE
+        self._throttle_tile_px = max(1, dot_radius * 2)
+        self._last_add_ms = {}
+        self._throttle_purge_ms = 0
+
+        # Dirty area accumulated between event-loop passes; flushed with a single update()
+        self._dirty = QRegion()
+        self._paint_pending = False
         
         # Setup window
         self.setWindowTitle("Student Tap Overlay")
@@ -92,45 +136,62 @@ class SimpleOverlayWindow(QWidget):
         if self.debug_bg:
             # Show faint border / tint for diagnostics only
             self.setStyleSheet("background: rgba(30,30,30,120);")
+            self._debug_pen = QPen(QColor(255, 255, 0, 120), 1)
         else:
             self.setStyleSheet("")
         
+        # Native handle is resolved once on first use; extended styles are applied only once
+        self._hwnd = 0
+        self._transparency_applied = False
+
         # Apply Windows-specific transparency and click-through
         if HAS_WIN32 and not self.force_basic:
             # Allow time for window to fully create before applying extended styles
             QTimer.singleShot(120, self._apply_windows_transparency)
             
-        # Timer for cleanup
+        # Single-shot cleanup timer, armed for the oldest dot's expiry only while dots exist
         self.update_timer = QTimer()
+        self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self._cleanup_dots)
-        self.update_timer.start(1000)  # Every second
+
+        # Fade timer: runs only while dots exist, ticking once per alpha-bucket step
+        # (fade_ms / ALPHA_BUCKETS) since finer steps would not change any sprite
+        self._fade_timer = QTimer()
+        self._fade_timer.setInterval(max(1, self.fade_ms // self.ALPHA_BUCKETS))
+        self._fade_timer.timeout.connect(self._refresh_fade)
         
         # Diagnostics
         self._paint_count = 0
         logger.info(f"Simple overlay window created: {width}x{height} at ({x}, {y}) debug={debug_bg} force_basic={self.force_basic}")
         try:
-            hwnd_dbg = int(self.winId())
-            logger.info(f"Overlay HWND={hwnd_dbg} flags={hex(int(self.windowFlags()))} attrs: translucent={self.testAttribute(Qt.WA_TranslucentBackground)} autoFill={self.autoFillBackground()}")
+            logger.info(f"Overlay HWND={self._native_hwnd()} flags={hex(int(self.windowFlags()))} attrs: translucent={self.testAttribute(Qt.WA_TranslucentBackground)} autoFill={self.autoFillBackground()}")
         except Exception:
             pass
     
+    def _native_hwnd(self) -> int:
+        """Return the native window handle, calling winId() only the first time."""
+        if not self._hwnd:
+            self._hwnd = int(self.winId())
+        return self._hwnd
+
     def _apply_windows_transparency(self):
         """Apply Windows-specific transparency for click-through behavior."""
+        if self._transparency_applied:
+            return
         try:
-            import win32gui
-            import win32con
-            
-            hwnd = int(self.winId())
+            hwnd = self._native_hwnd()
             if hwnd:
                 # Get current extended style
-                extended_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+                extended_style = _GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
                 # Add transparent, layered, and no-activate flags
                 new_style = (extended_style | win32con.WS_EX_TRANSPARENT | 
                            win32con.WS_EX_LAYERED | win32con.WS_EX_TOPMOST | 
                            win32con.WS_EX_NOACTIVATE)
-                win32gui.SetWindowLong(hwnd, win32con.GWL_EXSTYLE, new_style)
-                # Set layer attributes for transparency
-                win32gui.SetLayeredWindowAttributes(hwnd, 0, 255, win32con.LWA_ALPHA)
+                _SetWindowLong(hwnd, win32con.GWL_EXSTYLE, new_style)
+                # No SetLayeredWindowAttributes: WA_TranslucentBackground already drives per-pixel
+                # alpha through UpdateLayeredWindow, and a global LWA_ALPHA of 255 only adds a DWM
+                # blend pass (and makes later UpdateLayeredWindow calls fail)
+                self._transparency_applied = True
                 logger.debug(f"Applied Windows click-through styles to HWND {hwnd}")
         except Exception as e:
             logger.debug(f"Windows transparency failed: {e}")
@@ -140,44 +201,79 @@ class SimpleOverlayWindow(QWidget):
         
         Coordinates should already be properly scaled for the overlay widget.
         This method no longer applies DPI heuristics since proper scaling 
-        is handled in the calling code.
+        is handled in the calling code. Taps arriving faster than
+        MAX_TAP_RATE on the same dot-sized tile are dropped.
         """
-        timestamp = time.time()
+        now_ms = _now_ms()
+        interval = self._min_dot_interval_ms
+        if now_ms - self._throttle_purge_ms >= interval:
+            # Tiles idle for a full interval can no longer throttle anything; dropping them
+            # (at most once per interval) keeps the map to the tiles tapped very recently
+            self._last_add_ms = {t: ms for t, ms in self._last_add_ms.items() if now_ms - ms < interval}
+            self._throttle_purge_ms = now_ms
+        tile = (int(x) // self._throttle_tile_px, int(y) // self._throttle_tile_px)
+        if now_ms - self._last_add_ms.get(tile, 0) < interval:
+            return
+        self._last_add_ms[tile] = now_ms
+
         w = self.width()
         h = self.height()
-        dpr = self.devicePixelRatioF() if hasattr(self, 'devicePixelRatioF') else 1.0
+        # Debug logging is off in normal runs: skip the formatting (and the dpr query) entirely
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Log the coordinates we received for debugging
-        logger.debug(f"Overlay add_dot called: ({x:.1f}, {y:.1f}) widget_size={w}x{h} dpr={dpr:.2f}")
+        if debug:
+            dpr = self.devicePixelRatioF() if hasattr(self, 'devicePixelRatioF') else 1.0
+            logger.debug("Overlay add_dot called: (%.1f, %.1f) widget_size=%dx%d dpr=%.2f", x, y, w, h, dpr)
         
         # Simple bounds check - allow small margin for edge cases
         if x < -20 or y < -20 or x > w + 20 or y > h + 20:
-            logger.warning(f"Dot out of bounds: ({x:.1f},{y:.1f}) widget={w}x{h} - adding anyway")
+            logger.warning("Dot out of bounds: (%.1f,%.1f) widget=%dx%d - adding anyway", x, y, w, h)
             # Note: We still add the dot even if out of bounds for debugging
         
-        self.dots.append((x, y, timestamp))
-        logger.debug(f"Added dot to overlay: ({x:.1f}, {y:.1f}) total_dots={len(self.dots)}")
+        if len(self.dots) == self.dots.maxlen:
+            # Full ring buffer: the append below evicts the oldest dot, and no expiry path
+            # will ever see it again, so its box has to be repainted here
+            x0, y0, _ = self.dots.popleft()
+            self._queue_paint(self._dot_rect(x0, y0))
+        r = self.dot_radius
+        dot = (int(x - r), int(y - r), now_ms)
+        self.dots.append(dot)
+        if debug:
+            logger.debug("Added dot to overlay: (%.1f, %.1f) total_dots=%d", x, y, len(self.dots))
         
-        # Force immediate repaint
-        self.update()
-        self.repaint()
-        
-        # Also force Windows repaint if available
-        if HAS_WIN32:
-            try:
-                import win32gui
-                hwnd = int(self.winId())
-                win32gui.InvalidateRect(hwnd, None, True)
-                win32gui.UpdateWindow(hwnd)
-            except Exception:
-                pass
+        # Repaint only the new dot's box, coalesced with any other taps in this burst
+        self._queue_paint(self._dot_rect(dot[0], dot[1]))
+        self._schedule_cleanup()
         
         # Ensure visibility
         if not self.isVisible():
             self.show()
+
+    def _queue_paint(self, area):
+        """Add a QRect/QRegion to the dirty area and flush once after pending events run."""
+        self._dirty = self._dirty.united(area)
+        if not self._paint_pending:
+            self._paint_pending = True
+            QTimer.singleShot(0, self._flush_paint)
+
+    def _flush_paint(self):
+        """Issue one update() covering every dot added since the last flush."""
+        self._paint_pending = False
+        dirty, self._dirty = self._dirty, QRegion()
+        if not dirty.isEmpty():
+            self.update(dirty)
+
+    def _dot_rect(self, x0, y0) -> QRect:
+        """Widget-space bounding box of a dot whose sprite starts at (x0, y0), padded 1px for antialiasing."""
+        size = self.dot_radius * 2 + 2
+        return QRect(x0 - 1, y0 - 1, size, size)
     
     def clear_dots(self):
         """Remove all dots from the overlay."""
+        self._last_add_ms.clear()
+        self.update_timer.stop()
+        self._fade_timer.stop()
         if self.dots:
             self.dots.clear()
             self.update()
@@ -187,59 +283,186 @@ class SimpleOverlayWindow(QWidget):
         """Remove expired dots and trigger repaint if needed."""
         if not self.dots:
             return
+        if not self.isVisible() or self.windowState() & Qt.WindowMinimized:
+            # Nothing reaches the screen; showEvent re-arms expiry when the overlay returns
+            return
         
-        current_time = time.time()
+        cutoff = _now_ms() - self.fade_ms
         initial_count = len(self.dots)
         
-        # Remove expired dots
-        self.dots = [(x, y, timestamp) for x, y, timestamp in self.dots 
-                     if current_time - timestamp < self.DOT_DURATION]
+        # Dots are stored oldest first, so expired ones form a prefix of the buffer
+        dirty = QRegion()
+        while self.dots and self.dots[0][2] <= cutoff:
+            x0, y0, _ = self.dots.popleft()
+            dirty = dirty.united(self._dot_rect(x0, y0))
         
         if len(self.dots) != initial_count:
-            logger.debug(f"Removed {initial_count - len(self.dots)} expired dots")
-            self.update()
+            logger.debug("Removed %d expired dots", initial_count - len(self.dots))
+            self.update(dirty)
+        self._schedule_cleanup()
+
+    def _schedule_cleanup(self):
+        """Arm the cleanup timer for when the oldest dot expires and start the fade timer.
+
+        No-op while there are no dots or the timers are already running.
+        """
+        if not self.dots:
+            return
+        if not self.update_timer.isActive():
+            delay_ms = self.dots[0][2] + self.fade_ms - _now_ms()
+            self.update_timer.start(max(0, delay_ms))
+        if not self._fade_timer.isActive():
+            self._fade_timer.start()
+
+    def _refresh_fade(self):
+        """Repaint the live dots so each steps down to its current alpha bucket."""
+        if not self.dots or not self.isVisible() or self.windowState() & Qt.WindowMinimized:
+            # Restarted by _schedule_cleanup on the next dot or when the overlay is shown
+            self._fade_timer.stop()
+            return
+        if len(self.dots) <= self.FADE_UNION_LIMIT:
+            # Few dots: repaint just their boxes, not the (possibly screen-sized) gap between them
+            dirty = QRegion()
+            for x0, y0, _ in self.dots:
+                dirty = dirty.united(self._dot_rect(x0, y0))
+            self.update(dirty)
+            return
+        # Many dots: uniting N dot rects into a QRegion grows super-linearly and dominates
+        # the tick, so repaint one bounding rect instead
+        xs = [dot[0] for dot in self.dots]
+        ys = [dot[1] for dot in self.dots]
+        x0, y0 = min(xs), min(ys)
+        self.update(self._dot_rect(x0, y0).united(self._dot_rect(max(xs), max(ys))))
     
     def paintEvent(self, event):
-        """Paint the overlay with dots ensuring full transparency clearing first."""
+        """Paint the overlay with dots ensuring the damaged area is cleared to transparent first."""
+        if self.visibleRegion().isEmpty():
+            return
         painter = QPainter(self)
         try:
-            # Explicitly clear background for true transparency
+            # Explicitly clear the damaged area for true transparency (not the whole widget:
+            # on a 4K overlay that is ~32 MB of writes per paint for a few dot-sized updates)
             painter.setCompositionMode(QPainter.CompositionMode_Source)
-            painter.fillRect(self.rect(), Qt.transparent)
+            painter.fillRect(event.rect(), Qt.transparent)
             painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
 
-            painter.setRenderHint(QPainter.Antialiasing, True)
+            # Nothing left to draw (e.g. the paint that erases the last expired dots):
+            # the damaged area is cleared, so skip the clock read, diagnostics and dot loop
+            if not self.dots and not self.debug_bg:
+                return
+
+            # Dots are pre-antialiased sprites and the debug border is axis-aligned,
+            # so keep the painter on the cheaper non-antialiased raster path
+            painter.setRenderHint(QPainter.Antialiasing, False)
 
             if self.debug_bg:
-                painter.setPen(QPen(QColor(255, 255, 0, 120), 1))
+                painter.setPen(self._debug_pen)
                 painter.setBrush(Qt.NoBrush)
                 painter.drawRect(0, 0, self.width()-1, self.height()-1)
 
-            current_time = time.time()
+            now_ms = _now_ms()
+            fade_ms = self.fade_ms
             self._paint_count += 1
-            if self._paint_count <= 5 or self._paint_count % 100 == 0:
+            if (self._paint_count <= 5 or self._paint_count % 100 == 0) and logger.isEnabledFor(logging.DEBUG):
                 # Log initial few paints and then every 100th for diagnostics
                 try:
                     dpr = self.devicePixelRatioF() if hasattr(self, 'devicePixelRatioF') else 1.0
-                    logger.debug(f"paintEvent #{self._paint_count} dots={len(self.dots)} size={self.width()}x{self.height()} dpr={dpr:.2f}")
+                    logger.debug("paintEvent #%d dots=%d size=%dx%d dpr=%.2f",
+                                 self._paint_count, len(self.dots), self.width(), self.height(), dpr)
                 except Exception:
                     pass
-            for x, y, timestamp in self.dots:
-                if x < 0 or y < 0 or x > self.screen_width + 5 or y > self.screen_height + 5:
-                    logger.debug(f"Dot out of bounds skipped ({x},{y}) screen {self.screen_width}x{self.screen_height}")
-                    continue
-                age = current_time - timestamp
-                if age < self.DOT_DURATION:
-                    fade_factor = 1.0 - (age / self.DOT_DURATION)
-                    alpha = int(255 * fade_factor)
-                    color = QColor(self.dot_color)
-                    color.setAlpha(alpha)
-                    painter.setBrush(QBrush(color))
-                    painter.setPen(Qt.NoPen)
-                    painter.drawEllipse(int(x - self.dot_radius), int(y - self.dot_radius), self.dot_radius*2, self.dot_radius*2)
+            # Only dots whose box overlaps the damaged area need drawing: widen the clip
+            # rect by the (padded) sprite size once and compare sprite corners against it.
+            # The screen bounds check (centre within the screen plus a 5px margin) is folded
+            # into the same window, so each dot costs a single chained range comparison.
+            clip = event.rect()
+            r = self.dot_radius
+            span = 2 * r + 1
+            cx0 = max(clip.left() - span, -r)
+            cy0 = max(clip.top() - span, -r)
+            cx1 = min(clip.right() + 1, self.screen_width + 5 - r)
+            cy1 = min(clip.bottom() + 1, self.screen_height + 5 - r)
+            cutoff = now_ms - fade_ms
+            sprites = []
+            append = sprites.append
+            for x0, y0, timestamp in self.dots:
+                if cx0 <= x0 <= cx1 and cy0 <= y0 <= cy1 and timestamp > cutoff:
+                    # Integer 0-255 alpha straight from integer ms; no float round-trip
+                    append((x0, y0, 255 - ((now_ms - timestamp) * 255) // fade_ms))
+            if sprites:
+                self._draw_sprites(painter, sprites)
         finally:
             painter.end()
+
+    def _build_dot_sprite(self, dpr: float, alpha: int) -> QPixmap:
+        """Render one antialiased dot with the given alpha at the given device pixel ratio.
+
+        The pixmap uses the platform's premultiplied ARGB format with the fade already
+        applied, so drawing it is a plain blit with no opacity multiply.
+        """
+        size = self.dot_radius * 2
+        sprite = QPixmap(max(1, round(size * dpr)), max(1, round(size * dpr)))
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.transparent)
+        color = QColor(self.dot_color)
+        color.setAlpha(alpha)
+        sprite_painter = QPainter(sprite)
+        try:
+            sprite_painter.setRenderHint(QPainter.Antialiasing, True)
+            sprite_painter.setPen(Qt.NoPen)
+            sprite_painter.setBrush(QBrush(color))
+            sprite_painter.drawEllipse(0, 0, size, size)
+        finally:
+            sprite_painter.end()
+        return sprite
+
+    def _sprite_for(self, bucket: int, dpr: float) -> QPixmap:
+        """Return the cached dot sprite for an alpha bucket, building it on first use."""
+        if dpr != self._sprite_dpr:
+            self._sprite_cache.clear()
+            self._sprite_dpr = dpr
+        sprite = self._sprite_cache.get(bucket)
+        if sprite is None:
+            # Spread the buckets over the full 0..255 range so the top bucket is opaque
+            sprite = self._build_dot_sprite(dpr, bucket * 255 // (self.ALPHA_BUCKETS - 1))
+            self._sprite_cache[bucket] = sprite
+        return sprite
+
+    def _draw_sprites(self, painter: QPainter, sprites: List[Tuple[int, int, int]]):
+        """Blit a dot sprite at each (x0, y0, alpha 0-255) top-left entry.
+
+        Dots are grouped into ALPHA_BUCKETS fade levels so each level's pre-tinted
+        sprite is looked up once; every dot is then one plain drawPixmap blit with no
+        brush, pen or opacity change. The lowest bucket is practically invisible and
+        is skipped.
+        """
+        shift = 8 - (self.ALPHA_BUCKETS - 1).bit_length()
+        groups = {}
+        group = groups.setdefault
+        for x0, y0, alpha in sprites:
+            bucket = alpha >> shift
+            if bucket:
+                group(bucket, []).append((x0, y0))
+
+        dpr = self.devicePixelRatioF()
+        draw = painter.drawPixmap
+        for bucket, points in groups.items():
+            sprite = self._sprite_for(bucket, dpr)
+            for x0, y0 in points:
+                draw(x0, y0, sprite)
     
+    def showEvent(self, event):
+        """Re-resolve the cached HWND and resume dot expiry whenever the window is (re)shown."""
+        super().showEvent(event)
+        hwnd = int(self.winId())
+        if hwnd != self._hwnd:
+            # A recreated native window loses its extended styles, so click-through is re-applied
+            self._hwnd = hwnd
+            if HAS_WIN32 and not self.force_basic:
+                self._transparency_applied = False
+                QTimer.singleShot(0, self._apply_windows_transparency)
+        self._schedule_cleanup()
+
     def show(self):
         """Show the overlay window and ensure it's properly positioned."""
         super().show()
@@ -252,6 +475,7 @@ class SimpleOverlayWindow(QWidget):
         """Clean up when the window is closed."""
         if self.update_timer:
             self.update_timer.stop()
+        self._fade_timer.stop()
         self.clear_dots()
         logger.info("Simple overlay window closed")
         super().closeEvent(event)
@@ -7,23 +7,43 @@ for testing purposes in the Linux dev container environment.
 
 import time
 import logging
+from collections import deque
 from typing import List, Tuple
 
 from PySide6.QtWidgets import QWidget, QApplication
 from PySide6.QtCore import Qt, QTimer, QRect
-from PySide6.QtGui import QPainter, QBrush, QColor, QPen
+from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QPixmap, QRegion
 
 logger = logging.getLogger(__name__)
 
 
 class LinuxOverlayWindow(QWidget):
     """Linux-compatible overlay window for testing."""
+
+    # Room around the disc for the 3px outline
+    _SPRITE_PAD = 2
+    # Fade repaints per DOT_DURATION, matching overlay.py's ALPHA_BUCKETS
+    _FADE_STEPS = 16
     
     def __init__(self):
         super().__init__()
-        self.dots = []
+        self.dots = deque()
         self.DOT_SIZE = 20
         self.DOT_DURATION = 3.0
+
+        # Pre-rendered opaque dot, rebuilt only when DOT_SIZE changes; faded per dot via opacity
+        self._sprite = None
+        self._sprite_size = 0
+        self._tint = QColor(0, 0, 0, 50)
+
+        # Single-shot expiry timer, armed for the oldest dot instead of polling
+        self.cleanup_timer = QTimer(self)
+        self.cleanup_timer.setSingleShot(True)
+        self.cleanup_timer.timeout.connect(self._cleanup_dots)
+
+        # Repaints live dots once per fade step so they visibly fade between add and expiry
+        self._fade_timer = QTimer(self)
+        self._fade_timer.timeout.connect(self._refresh_fade)
         
         # Basic window setup
         self.setWindowFlags(
@@ -41,62 +61,116 @@ class LinuxOverlayWindow(QWidget):
         logger.info("Created Linux-compatible overlay window")
     
     def add_dot(self, x, y):
-        """Add a dot and force repaint."""
-        timestamp = time.time()
-        self.dots.append((x, y, timestamp))
-        logger.info(f"✅ Dot added to Linux overlay at ({x}, {y})")
+        """Add a dot and schedule a repaint."""
+        timestamp = time.monotonic_ns()
+        # Store the sprite's integer top-left so paintEvent does no per-dot geometry
+        offset = self.DOT_SIZE // 2 + self._SPRITE_PAD
+        x0, y0 = int(x) - offset, int(y) - offset
+        self.dots.append((x0, y0, timestamp))
+        logger.info("✅ Dot added to Linux overlay at (%s, %s)", x, y)
         
-        self.update()
-        self.repaint()
+        # update() lets Qt coalesce a burst of taps into one paint; only the dot's box is dirtied
+        self.update(self._dot_rect(x0, y0))
         
         if not self.isVisible():
             self.show()
             self.raise_()
         
-        # Start cleanup timer if not already running
-        if not hasattr(self, 'cleanup_timer'):
-            self.cleanup_timer = QTimer()
-            self.cleanup_timer.timeout.connect(self._cleanup_dots)
-            self.cleanup_timer.start(100)
+        if not self.cleanup_timer.isActive():
+            self._schedule_cleanup()
     
     def _cleanup_dots(self):
         """Remove expired dots."""
-        current_time = time.time()
-        old_count = len(self.dots)
-        self.dots = [(x, y, timestamp) for x, y, timestamp in self.dots 
-                     if current_time - timestamp < self.DOT_DURATION]
+        current_ns = time.monotonic_ns()
+        fade_ns = int(self.DOT_DURATION * 1_000_000_000)
+        cutoff = current_ns - fade_ns
+        # Dots are appended in timestamp order, so expired ones form a prefix
+        dirty = QRegion()
+        while self.dots and self.dots[0][2] <= cutoff:
+            x0, y0, _ = self.dots.popleft()
+            dirty = dirty.united(self._dot_rect(x0, y0))
         
-        if len(self.dots) != old_count:
-            self.update()
+        if not dirty.isEmpty():
+            self.update(dirty)
         
-        # Stop timer if no dots left
-        if not self.dots and hasattr(self, 'cleanup_timer'):
+        self._schedule_cleanup()
+    
+    def _schedule_cleanup(self):
+        """Arm the expiry timer for the oldest dot; leave it idle when there are none."""
+        if not self.dots:
             self.cleanup_timer.stop()
+            self._fade_timer.stop()
+            return
+        fade_ns = int(self.DOT_DURATION * 1_000_000_000)
+        remaining_ns = self.dots[0][2] + fade_ns - time.monotonic_ns()
+        self.cleanup_timer.start(max(0, remaining_ns // 1_000_000 + 1))
+        if not self._fade_timer.isActive():
+            # DOT_DURATION may be changed after construction, so the step is read here
+            self._fade_timer.start(max(1, int(self.DOT_DURATION * 1000) // self._FADE_STEPS))
+
+    def _refresh_fade(self):
+        """Repaint the live dots so each steps down to its current opacity."""
+        if not self.dots:
+            # Restarted by _schedule_cleanup on the next dot
+            self._fade_timer.stop()
+            return
+        xs = [dot[0] for dot in self.dots]
+        ys = [dot[1] for dot in self.dots]
+        self.update(self._dot_rect(min(xs), min(ys)).united(self._dot_rect(max(xs), max(ys))))
     
+    def _dot_rect(self, x0, y0) -> QRect:
+        """Widget-space box covering the dot sprite drawn with its top-left at (x0, y0)."""
+        extent = self.DOT_SIZE + 2 * self._SPRITE_PAD
+        return QRect(x0, y0, extent, extent)
+
+    def _dot_sprite(self) -> QPixmap:
+        """Return the antialiased dot sprite, rendering it on first use or after a size change."""
+        if self._sprite is None or self._sprite_size != self.DOT_SIZE:
+            pad = self._SPRITE_PAD
+            extent = self.DOT_SIZE + 2 * pad
+            sprite = QPixmap(extent, extent)
+            sprite.fill(Qt.GlobalColor.transparent)
+            color = QColor(255, 0, 0)
+            sprite_painter = QPainter(sprite)
+            sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            sprite_painter.setPen(QPen(color, 3))
+            sprite_painter.setBrush(QBrush(color))
+            sprite_painter.drawEllipse(pad, pad, self.DOT_SIZE, self.DOT_SIZE)
+            sprite_painter.end()
+            self._sprite = sprite
+            self._sprite_size = self.DOT_SIZE
+        return self._sprite
+
     def paintEvent(self, event):
         """Simple paint event."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         
-        # Semi-transparent background for visibility in testing
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 50))
+        # Semi-transparent background for visibility in testing (dirty area only)
+        clip = event.rect()
+        painter.fillRect(clip, self._tint)
         
-        current_time = time.time()
+        current_ns = time.monotonic_ns()
+        fade_ns = int(self.DOT_DURATION * 1_000_000_000)
+        sprite = self._dot_sprite()
+        # Only sprites overlapping the damaged area need drawing: widen the clip rect by
+        # the sprite extent once and compare sprite corners against it
+        extent = self.DOT_SIZE + 2 * self._SPRITE_PAD
+        cx0, cy0 = clip.left() - extent + 1, clip.top() - extent + 1
+        cx1, cy1 = clip.right(), clip.bottom()
+        set_opacity = painter.setOpacity
+        draw = painter.drawPixmap
         
-        for x, y, timestamp in self.dots:
-            age = current_time - timestamp
-            if age >= self.DOT_DURATION:
+        for x0, y0, timestamp in self.dots:
+            age_ns = current_ns - timestamp
+            if age_ns >= fade_ns:
+                continue
+            if not (cx0 <= x0 <= cx1 and cy0 <= y0 <= cy1):
                 continue
                 
-            fade_factor = 1.0 - (age / self.DOT_DURATION)
-            alpha = int(255 * fade_factor)
-            
-            color = QColor(255, 0, 0, alpha)
-            painter.setPen(QPen(color, 3))
-            painter.setBrush(QBrush(color))
+            alpha = 255 - (age_ns * 255) // fade_ns
             
-            painter.drawEllipse(int(x - self.DOT_SIZE//2), int(y - self.DOT_SIZE//2), 
-                              self.DOT_SIZE, self.DOT_SIZE)
+            set_opacity(alpha / 255.0)
+            draw(x0, y0, sprite)
         
         painter.end()
 